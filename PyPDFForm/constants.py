@@ -22,6 +22,7 @@ VERSION_IDENTIFIERS = [
     b"%PDF-2.0",
 ]
 VERSION_IDENTIFIER_PREFIX = b"%PDF-"
+JPEG_MAGIC_BYTES = b"\xff\xd8\xff"
 
 WIDGET_TYPES = Union[Text, Checkbox, Radio, Dropdown, Signature, Image]
 
@@ -53,6 +54,7 @@ CA = "/CA"
 AS = "/AS"
 Yes = "/Yes"
 Off = "/Off"
+Contents = "/Contents"
 
 # For Adobe Acrobat
 AcroForm = "/AcroForm"
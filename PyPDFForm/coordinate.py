@@ -1,19 +1,29 @@
 # -*- coding: utf-8 -*-
 """Contains helpers for coordinates calculations."""
 
-from copy import deepcopy
+from copy import copy
 from typing import List, Tuple, Union
 
 from pypdf import PdfReader
-from reportlab.pdfbase.pdfmetrics import stringWidth
 
 from .constants import (COORDINATE_GRID_FONT_SIZE_MARGIN_RATIO, DEFAULT_FONT,
                         Rect)
+from .font import get_string_width
 from .middleware.text import Text
 from .template import (get_char_rect_width, get_widget_alignment,
                        is_text_multiline)
 from .utils import stream_to_io
-from .watermark import create_watermarks_and_draw, merge_watermarks_with_pdf
+from .watermark import (build_content_stream, create_page_watermark_and_draw,
+                        merge_content_streams_with_pdf,
+                        merge_watermarks_with_pdf)
+
+
+def get_widget_rect(widget: dict) -> Tuple[float, float, float, float]:
+    """Returns the rectangle of a PDF form widget as floats."""
+
+    rect = widget[Rect]
+
+    return float(rect[0]), float(rect[1]), float(rect[2]), float(rect[3])
 
 
 def get_draw_checkbox_radio_coordinates(
@@ -22,13 +32,14 @@ def get_draw_checkbox_radio_coordinates(
 ) -> Tuple[Union[float, int], Union[float, int]]:
     """Returns coordinates to draw at given a PDF form checkbox/radio widget."""
 
+    x1, y1, x2, y2 = get_widget_rect(widget)
     string_height = widget_middleware.font_size * 96 / 72
-    width_mid_point = (float(widget[Rect][0]) + float(widget[Rect][2])) / 2
-    height_mid_point = (float(widget[Rect][1]) + float(widget[Rect][3])) / 2
+    width_mid_point = (x1 + x2) / 2
+    height_mid_point = (y1 + y2) / 2
 
     return (
         width_mid_point
-        - stringWidth(
+        - get_string_width(
             widget_middleware.value,
             widget_middleware.font,
             widget_middleware.font_size,
@@ -45,12 +56,9 @@ def get_draw_image_coordinates_resolutions(
     Returns coordinates and resolutions to draw image at given a PDF form signature/image widget.
     """
 
-    x = float(widget[Rect][0])
-    y = float(widget[Rect][1])
-    width = abs(float(widget[Rect][0]) - float(widget[Rect][2]))
-    height = abs(float(widget[Rect][1]) - float(widget[Rect][3]))
+    x1, y1, x2, y2 = get_widget_rect(widget)
 
-    return x, y, width, height
+    return x1, y1, abs(x1 - x2), abs(y1 - y2)
 
 
 def get_draw_text_coordinates(
@@ -58,10 +66,12 @@ def get_draw_text_coordinates(
 ) -> Tuple[Union[float, int], Union[float, int]]:
     """Returns coordinates to draw text at given a PDF form text widget."""
 
+    x1, y1, x2, y2 = get_widget_rect(widget)
+
     if widget_middleware.preview:
         return (
-            float(widget[Rect][0]),
-            float(widget[Rect][3]) + 5,
+            x1,
+            y2 + 5,
         )
 
     text_value = widget_middleware.value or ""
@@ -81,49 +91,51 @@ def get_draw_text_coordinates(
         else widget_middleware.character_paddings
     )
 
-    alignment = get_widget_alignment(widget) or 0
-    x = float(widget[Rect][0])
+    alignment = int(get_widget_alignment(widget) or 0)
+    x = x1
 
-    if int(alignment) != 0:
-        width_mid_point = (float(widget[Rect][0]) + float(widget[Rect][2])) / 2
-        string_width = stringWidth(
-            text_value,
-            widget_middleware.font,
-            widget_middleware.font_size,
-        )
-        if widget_middleware.comb is True and length:
-            string_width = character_paddings[-1] + stringWidth(
+    if alignment != 0:
+        width_mid_point = (x1 + x2) / 2
+        last_char_width = (
+            get_string_width(
                 text_value[-1],
                 widget_middleware.font,
                 widget_middleware.font_size,
             )
+            if widget_middleware.comb is True and length
+            else 0
+        )
+        string_width = (
+            character_paddings[-1] + last_char_width
+            if widget_middleware.comb is True and length
+            else get_string_width(
+                text_value,
+                widget_middleware.font,
+                widget_middleware.font_size,
+            )
+        )
 
-        if int(alignment) == 1:
+        if alignment == 1:
             x = width_mid_point - string_width / 2
-        elif int(alignment) == 2:
-            x = float(widget[Rect][2]) - string_width
+        elif alignment == 2:
+            x = x2 - string_width
             if length > 0 and widget_middleware.comb is True:
                 x -= (
-                    get_char_rect_width(widget, widget_middleware)
-                    - stringWidth(
-                        text_value[-1],
-                        widget_middleware.font,
-                        widget_middleware.font_size,
-                    )
+                    get_char_rect_width(widget, widget_middleware) - last_char_width
                 ) / 2
 
     string_height = widget_middleware.font_size * 96 / 72
-    height_mid_point = (float(widget[Rect][1]) + float(widget[Rect][3])) / 2
+    height_mid_point = (y1 + y2) / 2
     y = (height_mid_point - string_height / 2 + height_mid_point) / 2
     if is_text_multiline(widget):
-        y = float(widget[Rect][3]) - string_height / 1.5
+        y = y2 - string_height / 1.5
 
-    if int(alignment) == 1 and widget_middleware.comb is True and length != 0:
+    if alignment == 1 and widget_middleware.comb is True and length != 0:
         x -= character_paddings[0] / 2
         if length % 2 == 0:
             x -= (
                 character_paddings[0]
-                + stringWidth(
+                + get_string_width(
                     text_value[:1],
                     widget_middleware.font,
                     widget_middleware.font_size,
@@ -150,7 +162,8 @@ def get_text_line_x_coordinates(
         and len(widget_middleware.value) > widget_middleware.text_wrap_length
     ):
         result = []
-        _widget = deepcopy(widget_middleware)
+        # only scalar attributes are overridden so a shallow copy is enough
+        _widget = copy(widget_middleware)
         for each in widget_middleware.text_lines:
             _widget.value = each
             _widget.text_wrap_length = None
@@ -166,6 +179,9 @@ def generate_coordinate_grid(
 ) -> bytes:
     """Creates a grid view for the coordinates of a PDF."""
 
+    # pylint: disable=C0415
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
     pdf_file = PdfReader(stream_to_io(pdf))
     lines_by_page = {}
     texts_by_page = {}
@@ -209,16 +225,15 @@ def generate_coordinate_grid(
                 y += margin
             x += margin
 
-    for page, lines in lines_by_page.items():
-        watermarks.append(
-            create_watermarks_and_draw(pdf, page, "line", lines)[page - 1]
-        )
-
-    result = merge_watermarks_with_pdf(pdf, watermarks)
-    watermarks = []
     for page, texts in texts_by_page.items():
         watermarks.append(
-            create_watermarks_and_draw(pdf, page, "text", texts)[page - 1]
+            create_page_watermark_and_draw(pdf_file.pages[page - 1], {"text": texts})
         )
 
+    result = merge_content_streams_with_pdf(
+        pdf,
+        [build_content_stream({"line": lines}) for lines in lines_by_page.values()],
+        pdf_file,
+    )
+
     return merge_watermarks_with_pdf(result, watermarks)
@@ -24,74 +24,62 @@ from .patterns import (simple_flatten_generic, simple_flatten_radio,
                        simple_update_checkbox_value,
                        simple_update_dropdown_value, simple_update_radio_value,
                        simple_update_text_value)
-from .template import get_widget_key, get_widgets_by_page
+from .template import get_widget_key, get_widget_keys_by_page
 from .utils import checkbox_radio_to_draw, stream_to_io
-from .watermark import create_watermarks_and_draw, merge_watermarks_with_pdf
+from .watermark import (create_page_watermark_and_draw,
+                        merge_watermarks_with_pdf)
 
 
 def check_radio_handler(
-    widget: dict, middleware: Union[Checkbox, Radio], radio_button_tracker: dict
-) -> Tuple[Text, Union[float, int], Union[float, int], bool]:
+    widget: dict, middleware: Union[Checkbox, Radio]
+) -> Tuple[
+    Union[Text, None], Union[float, int, None], Union[float, int, None], bool
+]:
     """Handles draw parameters for checkbox and radio button widgets.
     
     Args:
         widget: Dictionary containing widget properties
         middleware: Either a Checkbox or Radio widget handler
-        radio_button_tracker: Dictionary tracking radio button states
     
     Returns:
         Tuple containing:
-        - Text to draw
-        - X coordinate
-        - Y coordinate
+        - Text to draw, None if nothing needs to be drawn
+        - X coordinate, None if nothing needs to be drawn
+        - Y coordinate, None if nothing needs to be drawn
         - Boolean indicating if text needs to be drawn
     """
+    # Radio buttons only get here for the selected option of their group,
+    # unchecked boxes have nothing to lay out
+    if middleware.KIND != Radio.KIND and not middleware.value:
+        return None, None, None, False
+
     # Get font size either from widget settings or middleware
     font_size = (
         checkbox_radio_font_size(widget) if middleware.size is None else middleware.size
     )
     to_draw = checkbox_radio_to_draw(middleware, font_size)
     x, y = get_draw_checkbox_radio_coordinates(widget, to_draw)
-    
-    # Determine if text needs to be drawn based on widget type and state
-    text_needs_to_be_drawn = False
-    if type(middleware) is Checkbox and middleware.value:
-        text_needs_to_be_drawn = True
-    elif isinstance(middleware, Radio):
-        # Track radio button groups and their selected states
-        if middleware.name not in radio_button_tracker:
-            radio_button_tracker[middleware.name] = 0
-        radio_button_tracker[middleware.name] += 1
-        if middleware.value == radio_button_tracker[middleware.name] - 1:
-            text_needs_to_be_drawn = True
 
-    return to_draw, x, y, text_needs_to_be_drawn
+    return to_draw, x, y, True
 
 
 def signature_image_handler(
     widget: dict, middleware: Union[Signature, Image], images_to_draw: list
-) -> bool:
+) -> None:
     """Processes signature and image widgets for drawing.
     
     Args:
         widget: Dictionary containing widget properties
         middleware: Either a Signature or Image widget handler
         images_to_draw: List to store image drawing instructions
-    
-    Returns:
-        Boolean indicating if there is an image to draw
     """
     stream = middleware.stream
-    any_image_to_draw = False
     if stream is not None:
-        any_image_to_draw = True
         # Convert any image format to JPG for consistency
         stream = any_image_to_jpg(stream)
         x, y, width, height = get_draw_image_coordinates_resolutions(widget)
         images_to_draw.append([stream, x, y, width, height])
 
-    return any_image_to_draw
-
 
 def text_handler(
     widget: dict, middleware: Text
@@ -114,26 +102,77 @@ def text_handler(
     return middleware, x, y, True
 
 
-def get_drawn_stream(to_draw: dict, stream: bytes, action: str) -> bytes:
+def draw_check_radio(
+    widget: dict, middleware: Union[Checkbox, Radio], to_draw: Dict[str, list]
+) -> None:
+    """Queues the tick of a checkbox or radio button widget for drawing.
+
+    Args:
+        widget: Dictionary containing widget properties
+        middleware: Either a Checkbox or Radio widget handler
+        to_draw: Drawing instructions of the widget's page grouped by type
+    """
+    text_to_draw, x, y, text_needs_to_be_drawn = check_radio_handler(
+        widget, middleware
+    )
+    if text_needs_to_be_drawn:
+        to_draw["text"].append([text_to_draw, x, y])
+
+
+def draw_signature_image(
+    widget: dict, middleware: Union[Signature, Image], to_draw: Dict[str, list]
+) -> None:
+    """Queues the image of a signature or image widget for drawing.
+
+    Args:
+        widget: Dictionary containing widget properties
+        middleware: Either a Signature or Image widget handler
+        to_draw: Drawing instructions of the widget's page grouped by type
+    """
+    signature_image_handler(widget, middleware, to_draw["image"])
+
+
+def draw_text_field(widget: dict, middleware: Text, to_draw: Dict[str, list]) -> None:
+    """Queues the value of a text field widget for drawing.
+
+    Args:
+        widget: Dictionary containing widget properties
+        middleware: Text widget handler
+        to_draw: Drawing instructions of the widget's page grouped by type
+    """
+    text_to_draw, x, y, _ = text_handler(widget, middleware)
+    to_draw["text"].append([text_to_draw, x, y])
+
+
+FILL_HANDLERS = {
+    Checkbox.KIND: draw_check_radio,
+    Radio.KIND: draw_check_radio,
+    Signature.KIND: draw_signature_image,
+    Image.KIND: draw_signature_image,
+    Text.KIND: draw_text_field,
+    Dropdown.KIND: draw_text_field,
+}
+
+
+def get_drawn_stream(to_draw: dict, stream: bytes) -> bytes:
     """Generates a PDF stream with elements drawn on it using watermarks.
     
     Args:
         to_draw: Dictionary mapping page numbers to drawing instructions
+            grouped by type ("text" or "image"), drawn in that order
         stream: Input PDF stream
-        action: Type of action ("text" or "image")
     
     Returns:
         Modified PDF stream with drawn elements
     """
-    watermark_list = []
+    pdf_file = PdfReader(stream_to_io(stream))
+    watermark_list = [b""] * len(pdf_file.pages)
     for page, stuffs in to_draw.items():
-        watermark_list.append(b"")
-        watermarks = create_watermarks_and_draw(stream, page, action, stuffs)
-        for i, watermark in enumerate(watermarks):
-            if watermark:
-                watermark_list[i] = watermark
+        watermark_list[page - 1] = create_page_watermark_and_draw(
+            pdf_file.pages[page - 1], stuffs
+        )
 
-    return merge_watermarks_with_pdf(stream, watermark_list)
+    return merge_watermarks_with_pdf(stream, watermark_list, pdf_file)
 
 
 def fill(
@@ -149,46 +188,30 @@ def fill(
     Returns:
         Modified PDF stream with filled form elements
     """
-    texts_to_draw = {}
-    images_to_draw = {}
-    any_image_to_draw = False
+    to_draw = {}
     radio_button_tracker = {}
 
     # Process each page and its widgets
-    for page, widget_dicts in get_widgets_by_page(template_stream).items():
-        texts_to_draw[page] = []
-        images_to_draw[page] = []
-        for widget_dict in widget_dicts:
-            key = get_widget_key(widget_dict)
-            text_needs_to_be_drawn = False
-            to_draw = x = y = None
-
-            # Handle different widget types
-            if isinstance(widgets[key], (Checkbox, Radio)):
-                to_draw, x, y, text_needs_to_be_drawn = check_radio_handler(
-                    widget_dict, widgets[key], radio_button_tracker
-                )
-            elif isinstance(widgets[key], (Signature, Image)):
-                any_image_to_draw |= signature_image_handler(
-                    widget_dict, widgets[key], images_to_draw[page]
-                )
-            else:
-                to_draw, x, y, text_needs_to_be_drawn = text_handler(
-                    widget_dict, widgets[key]
-                )
-
-            # Add drawing instructions if all parameters are valid
-            if all([text_needs_to_be_drawn, to_draw is not None, x is not None, y is not None]):
-                texts_to_draw[page].append([to_draw, x, y])
+    for page, widget_dicts in get_widget_keys_by_page(template_stream).items():
+        # Text goes first so that images are drawn on top of it
+        to_draw[page] = {"text": [], "image": []}
+        for key, widget_dict in widget_dicts:
+            middleware = widgets[key]
+            kind = middleware.KIND
 
-    # Draw text elements first
-    result = get_drawn_stream(texts_to_draw, template_stream, "text")
+            # Only the selected option of a radio button group is drawn
+            if kind == Radio.KIND:
+                index = radio_button_tracker.get(key, 0)
+                radio_button_tracker[key] = index + 1
+                if middleware.value != index:
+                    continue
 
-    # Draw images if any exist
-    if any_image_to_draw:
-        result = get_drawn_stream(images_to_draw, result, "image")
+            FILL_HANDLERS.get(kind, draw_text_field)(
+                widget_dict, middleware, to_draw[page]
+            )
 
-    return result
+    # Draw text and images of each page onto a single watermark
+    return get_drawn_stream(to_draw, template_stream)
 
 
 def enable_adobe_mode(pdf: PdfReader, adobe_mode: bool) -> None:
@@ -204,6 +227,23 @@ def enable_adobe_mode(pdf: PdfReader, adobe_mode: bool) -> None:
         )
 
 
+def simple_update_checkbox(annot: DictionaryObject, widget: Checkbox) -> None:
+    """Checks or unchecks a checkbox annotation.
+
+    Args:
+        annot: Checkbox annotation
+        widget: Checkbox widget handler
+    """
+    simple_update_checkbox_value(annot, widget.value)
+
+
+SIMPLE_FILL_HANDLERS = {
+    Checkbox.KIND: simple_update_checkbox,
+    Dropdown.KIND: simple_update_dropdown_value,
+    Text.KIND: simple_update_text_value,
+}
+
+
 def simple_fill(
     template: bytes,
     widgets: Dict[str, WIDGET_TYPES],
@@ -232,29 +272,27 @@ def simple_fill(
     for page in out.pages:
         for annot in page.get(Annots, []):
             annot = cast(DictionaryObject, annot.get_object())
-            key = get_widget_key(annot.get_object())
+            key = get_widget_key(annot)
 
             widget = widgets.get(key)
             if widget is None or widget.value is None:
                 continue
 
-            # Update different widget types
-            if type(widget) is Checkbox:
-                simple_update_checkbox_value(annot, widget.value)
-            elif isinstance(widget, Radio):
-                if key not in radio_button_tracker:
-                    radio_button_tracker[key] = 0
-                radio_button_tracker[key] += 1
-                if widget.value == radio_button_tracker[key] - 1:
+            # Update different widget types, signatures and images have no value
+            kind = widget.KIND
+            if kind == Radio.KIND:
+                index = radio_button_tracker.get(key, 0)
+                radio_button_tracker[key] = index + 1
+                if widget.value == index:
                     simple_update_radio_value(annot)
-            elif isinstance(widget, Dropdown):
-                simple_update_dropdown_value(annot, widget)
-            elif isinstance(widget, Text):
-                simple_update_text_value(annot, widget)
+            else:
+                handler = SIMPLE_FILL_HANDLERS.get(kind)
+                if handler is not None:
+                    handler(annot, widget)
 
             # Flatten form fields if requested
             if flatten:
-                if isinstance(widget, Radio):
+                if kind == Radio.KIND:
                     simple_flatten_radio(annot)
                 else:
                     simple_flatten_generic(annot)
@@ -262,5 +300,4 @@ def simple_fill(
     # Write the modified PDF to a bytes buffer
     with BytesIO() as f:
         out.write(f)
-        f.seek(0)
-        return f.read()
+        return f.getvalue()
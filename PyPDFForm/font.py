@@ -1,16 +1,12 @@
 # -*- coding: utf-8 -*-
 """Contains helpers for font."""
 
+from functools import lru_cache
 from io import BytesIO
 from math import sqrt
 from re import findall
 from typing import Tuple, Union
 
-from reportlab.pdfbase.acroform import AcroForm
-from reportlab.pdfbase.pdfmetrics import (registerFont, standardFonts,
-                                          stringWidth)
-from reportlab.pdfbase.ttfonts import TTFError, TTFont
-
 from .constants import (DEFAULT_FONT, FONT_COLOR_IDENTIFIER,
                         FONT_SIZE_IDENTIFIER, FONT_SIZE_REDUCE_STEP,
                         MARGIN_BETWEEN_LINES, Rect)
@@ -22,12 +18,16 @@ from .utils import traverse_pattern
 def register_font(font_name: str, ttf_stream: bytes) -> bool:
     """Registers a font from a ttf file stream."""
 
-    buff = BytesIO()
-    buff.write(ttf_stream)
-    buff.seek(0)
+    # pylint: disable=C0415
+    from reportlab.pdfbase.pdfmetrics import registerFont
+    from reportlab.pdfbase.ttfonts import TTFError, TTFont
+
+    buff = BytesIO(ttf_stream)
 
     try:
         registerFont(TTFont(name=font_name, filename=buff))
+        # the font registry changed, so drop widths measured against the old one
+        get_string_width.cache_clear()
         result = True
     except TTFError:
         result = False
@@ -36,12 +36,29 @@ def register_font(font_name: str, ttf_stream: bytes) -> bool:
     return result
 
 
+@lru_cache(maxsize=1024)
+def get_string_width(text: str, font: str, font_size: Union[float, int]) -> float:
+    """
+    Returns the width of a text drawn with a font,
+    cached since the same labels and ticks repeat across widgets.
+    """
+
+    # pylint: disable=C0415
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    return stringWidth(text, font, font_size)
+
+
 def extract_font_from_text_appearance(text_appearance: str) -> Union[str, None]:
     """
     Uses regex to pattern match out the font from the text
     appearance string of a text field widget.
     """
 
+    # pylint: disable=C0415
+    from reportlab.pdfbase.acroform import AcroForm
+    from reportlab.pdfbase.pdfmetrics import standardFonts
+
     text_appearances = text_appearance.split(" ")
 
     for each in text_appearances:
@@ -176,7 +193,7 @@ def adjust_text_field_font_size(widget: dict, widget_middleware: Text) -> None:
 
     while (
         widget_middleware.font_size > FONT_SIZE_REDUCE_STEP
-        and stringWidth(
+        and get_string_width(
             widget_middleware.value, widget_middleware.font, widget_middleware.font_size
         )
         > width
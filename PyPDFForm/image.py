@@ -1,26 +1,40 @@
 # -*- coding: utf-8 -*-
 """Contains helpers for image."""
 
+from functools import lru_cache
 from io import BytesIO
-from typing import Union
+from types import ModuleType
+from typing import Tuple, Union
 
 from PIL import Image
 
+from .constants import JPEG_MAGIC_BYTES
+
+
+@lru_cache()
+def import_simplejpeg() -> Union[Tuple[ModuleType, ModuleType], None]:
+    """Imports the optional simplejpeg encoder and numpy once, None if missing."""
+
+    try:
+        # pylint: disable=C0415
+        import numpy as np  # pyright: ignore[reportMissingImports]
+        import simplejpeg  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        return None
+
+    return np, simplejpeg
+
 
 def rotate_image(image_stream: bytes, rotation: Union[float, int]) -> bytes:
     """Rotates an image by a rotation angle."""
 
-    buff = BytesIO()
-    buff.write(image_stream)
-    buff.seek(0)
+    buff = BytesIO(image_stream)
 
     image = Image.open(buff)
 
     rotated_buff = BytesIO()
     image.rotate(rotation, expand=True).save(rotated_buff, format=image.format)
-    rotated_buff.seek(0)
-
-    result = rotated_buff.read()
+    result = rotated_buff.getvalue()
 
     buff.close()
     rotated_buff.close()
@@ -31,23 +45,30 @@ def rotate_image(image_stream: bytes, rotation: Union[float, int]) -> bytes:
 def any_image_to_jpg(image_stream: bytes) -> bytes:
     """Converts an image of any type to jpg."""
 
-    buff = BytesIO()
-    buff.write(image_stream)
-    buff.seek(0)
+    if image_stream.startswith(JPEG_MAGIC_BYTES):
+        return image_stream
 
-    image = Image.open(buff)
+    buff = BytesIO(image_stream)
 
-    if image.format == "JPEG":
-        buff.close()
-        return image_stream
+    image = Image.open(buff)
 
     rgb_image = Image.new("RGB", image.size, (255, 255, 255))
     rgb_image.paste(image, mask=image.split()[3] if len(image.split()) == 4 else None)
 
+    encoder = import_simplejpeg()
+    if encoder is not None:
+        np, simplejpeg = encoder
+        buff.close()
+        return simplejpeg.encode_jpeg(
+            np.asarray(rgb_image),
+            quality=75,
+            colorspace="RGB",
+            colorsubsampling="420",
+        )
+
     with BytesIO() as _file:
         rgb_image.save(_file, format="JPEG")
-        _file.seek(0)
-        result = _file.read()
+        result = _file.getvalue()
 
     buff.close()
     return result
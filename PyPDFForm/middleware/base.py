@@ -7,6 +7,9 @@ from typing import Any
 class Widget:
     """Base class for all PDF form widgets."""
 
+    KIND = "widget"
+    __slots__ = ("_name", "_value", "desc")
+
     def __init__(
         self,
         name: str,
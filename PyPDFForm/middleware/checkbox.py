@@ -9,6 +9,9 @@ from .base import Widget
 class Checkbox(Widget):
     """A class to represent a checkbox widget."""
 
+    KIND = "checkbox"
+    __slots__ = ("size", "_button_style")
+
     BUTTON_STYLE_MAPPING = {
         "check": "4",
         "cross": "5",
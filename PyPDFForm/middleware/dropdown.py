@@ -7,6 +7,9 @@ from .base import Widget
 class Dropdown(Widget):
     """A class to represent a dropdown widget."""
 
+    KIND = "dropdown"
+    __slots__ = ("choices",)
+
     def __init__(
         self,
         name: str,
@@ -6,3 +6,6 @@ from .signature import Signature
 
 class Image(Signature):
     """A class to represent an image field widget."""
+
+    KIND = "image"
+    __slots__ = ()
@@ -7,6 +7,9 @@ from .checkbox import Checkbox
 class Radio(Checkbox):
     """A class to represent a radiobutton widget."""
 
+    KIND = "radio"
+    __slots__ = ("number_of_options",)
+
     def __init__(
         self,
         name: str,
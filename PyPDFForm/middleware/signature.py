@@ -11,6 +11,9 @@ from .base import Widget
 class Signature(Widget):
     """A class to represent a signature field widget."""
 
+    KIND = "signature"
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
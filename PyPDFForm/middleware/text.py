@@ -9,6 +9,20 @@ from .base import Widget
 class Text(Widget):
     """A class to represent a text field widget."""
 
+    KIND = "text"
+    __slots__ = (
+        "font",
+        "font_size",
+        "font_color",
+        "text_wrap_length",
+        "max_length",
+        "comb",
+        "character_paddings",
+        "text_lines",
+        "text_line_x_coordinates",
+        "preview",
+    )
+
     def __init__(
         self,
         name: str,
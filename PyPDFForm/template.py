@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Contains helpers for generic template related processing."""
 
+from copy import copy
 from functools import lru_cache
 from io import BytesIO
 from sys import maxsize
@@ -8,13 +9,13 @@ from typing import Dict, List, Tuple, Union, cast
 
 from pypdf import PdfReader, PdfWriter
 from pypdf.generic import DictionaryObject
-from reportlab.pdfbase.pdfmetrics import stringWidth
 
 from .constants import (COMB, DEFAULT_FONT_SIZE, MULTILINE, NEW_LINE_SYMBOL,
                         WIDGET_TYPES, Annots, MaxLen, Rect)
 from .font import (adjust_paragraph_font_size, adjust_text_field_font_size,
-                   auto_detect_font, get_text_field_font_color,
-                   get_text_field_font_size, text_field_font_size)
+                   auto_detect_font, get_string_width,
+                   get_text_field_font_color, get_text_field_font_size,
+                   text_field_font_size)
 from .middleware.checkbox import Checkbox
 from .middleware.dropdown import Dropdown
 from .middleware.radio import Radio
@@ -24,7 +25,7 @@ from .patterns import (BUTTON_STYLE_PATTERNS, DROPDOWN_CHOICE_PATTERNS,
                        WIDGET_DESCRIPTION_PATTERNS, WIDGET_KEY_PATTERNS,
                        WIDGET_TYPE_PATTERNS, update_annotation_name)
 from .utils import find_pattern_match, stream_to_io, traverse_pattern
-from .watermark import create_watermarks_and_draw
+from .watermark import build_content_stream
 
 
 def set_character_x_paddings(
@@ -32,9 +33,8 @@ def set_character_x_paddings(
 ) -> Dict[str, WIDGET_TYPES]:
     """Sets paddings between characters for combed text fields."""
 
-    for _widgets in get_widgets_by_page(pdf_stream).values():
-        for widget in _widgets:
-            key = get_widget_key(widget)
+    for _widgets in get_widget_keys_by_page(pdf_stream).values():
+        for key, widget in _widgets:
             _widget = widgets[key]
 
             if isinstance(_widget, Text) and _widget.comb is True:
@@ -46,11 +46,20 @@ def set_character_x_paddings(
 def build_widgets(pdf_stream: bytes) -> Dict[str, WIDGET_TYPES]:
     """Builds a widget dict given a PDF form stream."""
 
+    # widgets get filled and styled by callers so each call gets its own copies
+    return {
+        key: copy(value) for key, value in get_template_widgets(pdf_stream).items()
+    }
+
+
+@lru_cache()
+def get_template_widgets(pdf_stream: bytes) -> Dict[str, WIDGET_TYPES]:
+    """Constructs the widgets of a PDF form stream once per template."""
+
     results = {}
 
-    for widgets in get_widgets_by_page(pdf_stream).values():
-        for widget in widgets:
-            key = get_widget_key(widget)
+    for widgets in get_widget_keys_by_page(pdf_stream).values():
+        for key, widget in widgets:
             _widget = construct_widget(widget, key)
             if _widget is not None:
                 _widget.desc = get_widget_description(widget)
@@ -76,12 +85,12 @@ def build_widgets(pdf_stream: bytes) -> Dict[str, WIDGET_TYPES]:
     return results
 
 
-def widget_rect_watermarks(pdf: bytes) -> List[bytes]:
-    """Draws the rectangular border of each widget and returns watermarks."""
+def widget_rect_content_streams(pdf: bytes) -> List[bytes]:
+    """Draws the rectangular border of each widget and returns content streams."""
 
-    watermarks = []
+    content_streams = []
 
-    for page, widgets in get_widgets_by_page(pdf).items():
+    for widgets in get_widgets_by_page(pdf).values():
         to_draw = []
         for widget in widgets:
             rect = widget[Rect]
@@ -91,11 +100,9 @@ def widget_rect_watermarks(pdf: bytes) -> List[bytes]:
             height = abs(rect[1] - rect[3])
 
             to_draw.append([x, y, width, height])
-        watermarks.append(
-            create_watermarks_and_draw(pdf, page, "rect", to_draw)[page - 1]
-        )
+        content_streams.append(build_content_stream({"rect": to_draw}))
 
-    return watermarks
+    return content_streams
 
 
 def dropdown_to_text(dropdown: Dropdown) -> Text:
@@ -119,9 +126,8 @@ def update_text_field_attributes(
 ) -> None:
     """Auto updates text fields' attributes."""
 
-    for _widgets in get_widgets_by_page(template_stream).values():
-        for _widget in _widgets:
-            key = get_widget_key(_widget)
+    for _widgets in get_widget_keys_by_page(template_stream).values():
+        for key, _widget in _widgets:
 
             if isinstance(widgets[key], Text):
                 should_adjust_font_size = False
@@ -178,6 +184,18 @@ def get_widgets_by_page(pdf: bytes) -> Dict[int, List[dict]]:
     return result
 
 
+@lru_cache()
+def get_widget_keys_by_page(
+    pdf: bytes,
+) -> Dict[int, List[Tuple[Union[str, list, None], dict]]]:
+    """Pairs each widget of a PDF with its annotated key, grouped by page."""
+
+    return {
+        page: [(get_widget_key(widget), widget) for widget in widgets]
+        for page, widgets in get_widgets_by_page(pdf).items()
+    }
+
+
 def get_widget_key(widget: dict) -> Union[str, list, None]:
     """Finds a PDF widget's annotated key by pattern matching."""
 
@@ -308,7 +326,10 @@ def get_character_x_paddings(widget: dict, widget_middleware: Text) -> List[floa
         current_mid_point = current_x + char_rect_width / 2
         result.append(
             current_mid_point
-            - stringWidth(char, widget_middleware.font, widget_middleware.font_size) / 2
+            - get_string_width(
+                char, widget_middleware.font, widget_middleware.font_size
+            )
+            / 2
         )
         current_x += char_rect_width
 
@@ -324,6 +345,9 @@ def split_characters_into_lines(
     where each line would fit into the widget's width.
     """
 
+    # pylint: disable=C0415
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
     lines = []
     for line in split_by_new_line_symbol:
         characters = line.split(" ")
@@ -355,6 +379,9 @@ def adjust_each_line(lines: List[str], middleware: Text, width: float) -> List[s
     unnecessary lines.
     """
 
+    # pylint: disable=C0415
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
     result = []
     for each in lines:
         tracker = ""
@@ -439,7 +466,7 @@ def update_widget_keys(
         for page in out.pages:
             for annot in page.get(Annots, []):  # noqa
                 annot = cast(DictionaryObject, annot.get_object())
-                key = get_widget_key(annot.get_object())
+                key = get_widget_key(annot)
 
                 widget = widgets.get(key)
                 if widget is None:
@@ -456,5 +483,4 @@ def update_widget_keys(
 
     with BytesIO() as f:
         out.write(f)
-        f.seek(0)
-        return f.read()
+        return f.getvalue()
@@ -16,13 +16,9 @@ from .middleware.text import Text
 
 
 def stream_to_io(stream: bytes) -> BinaryIO:
-    """Converts a byte stream to a binary io object."""
+    """Converts a byte stream to a binary io object without copying it."""
 
-    result = BytesIO()
-    result.write(stream)
-    result.seek(0)
-
-    return result
+    return BytesIO(stream)
 
 
 def checkbox_radio_to_draw(
@@ -38,7 +34,7 @@ def checkbox_radio_to_draw(
     new_widget.font_size = font_size
     new_widget.font_color = DEFAULT_FONT_COLOR
     new_widget.value = BUTTON_STYLES.get(widget.button_style) or (
-        DEFAULT_CHECKBOX_STYLE if type(widget) is Checkbox else DEFAULT_RADIO_STYLE
+        DEFAULT_CHECKBOX_STYLE if widget.KIND == Checkbox.KIND else DEFAULT_RADIO_STYLE
     )
 
     return new_widget
@@ -71,8 +67,7 @@ def remove_all_widgets(pdf: bytes) -> bytes:
         writer.add_page(page)
 
     writer.write(result_stream)
-    result_stream.seek(0)
-    return result_stream.read()
+    return result_stream.getvalue()
 
 
 def get_page_streams(pdf: bytes) -> List[bytes]:
@@ -86,8 +81,7 @@ def get_page_streams(pdf: bytes) -> List[bytes]:
         writer.add_page(page)
         with BytesIO() as f:
             writer.write(f)
-            f.seek(0)
-            result.append(f.read())
+            result.append(f.getvalue())
 
     return result
 
@@ -106,8 +100,7 @@ def merge_two_pdfs(pdf: bytes, other: bytes) -> bytes:
         output.add_page(page)
 
     output.write(result)
-    result.seek(0)
-    return result.read()
+    return result.getvalue()
 
 
 def find_pattern_match(pattern: dict, widget: Union[dict, DictionaryObject]) -> bool:
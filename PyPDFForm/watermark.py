@@ -1,15 +1,20 @@
 # -*- coding: utf-8 -*-
 """Contains helpers for watermark."""
 
+from __future__ import annotations
+
 from io import BytesIO
-from typing import List
+from typing import TYPE_CHECKING, Dict, List, Union
 
-from pypdf import PdfReader, PdfWriter
-from reportlab.lib.utils import ImageReader
-from reportlab.pdfgen.canvas import Canvas
+from pypdf import PageObject, PdfReader, PdfWriter
+from pypdf.generic import DecodedStreamObject, NameObject
 
+from .constants import Contents
 from .utils import stream_to_io
 
+if TYPE_CHECKING:
+    from reportlab.pdfgen.canvas import Canvas
+
 
 def draw_text(*args) -> None:
     """Draws a text on the watermark."""
@@ -72,39 +77,12 @@ def draw_text(*args) -> None:
         canvas.restoreState()
 
 
-def draw_line(*args) -> None:
-    """Draws a line on the watermark."""
-
-    canvas = args[0]
-    src_x = args[1]
-    src_y = args[2]
-    dest_x = args[3]
-    dest_y = args[4]
-    r = args[5]
-    g = args[6]
-    b = args[7]
-
-    canvas.saveState()
-    canvas.setStrokeColorRGB(r, g, b)
-    canvas.line(src_x, src_y, dest_x, dest_y)
-    canvas.restoreState()
-
-
-def draw_rect(*args) -> None:
-    """Draws a rectangle on the watermark."""
-
-    canvas = args[0]
-    x = args[1]
-    y = args[2]
-    width = args[3]
-    height = args[4]
-
-    canvas.rect(x, y, width, height)
-
-
 def draw_image(*args) -> None:
     """Draws an image on the watermark."""
 
+    # pylint: disable=C0415
+    from reportlab.lib.utils import ImageReader
+
     canvas = args[0]
     image_stream = args[1]
     coordinate_x = args[2]
@@ -112,9 +90,7 @@ def draw_image(*args) -> None:
     width = args[4]
     height = args[5]
 
-    image_buff = BytesIO()
-    image_buff.write(image_stream)
-    image_buff.seek(0)
+    image_buff = BytesIO(image_stream)
 
     canvas.drawImage(
         ImageReader(image_buff),
@@ -127,24 +103,58 @@ def draw_image(*args) -> None:
     image_buff.close()
 
 
-def create_watermarks_and_draw(
-    pdf: bytes,
-    page_number: int,
-    action_type: str,
-    actions: List[list],
-) -> List[bytes]:
-    """Creates a canvas watermark and draw some stuffs on it."""
+def line_operators(*args) -> bytes:
+    """Returns the PDF operators that draw a line."""
 
-    pdf_file = PdfReader(stream_to_io(pdf))
-    buff = BytesIO()
+    # pylint: disable=C0415
+    from reportlab.lib.rl_accel import fp_str
 
-    canvas = Canvas(
-        buff,
-        pagesize=(
-            float(pdf_file.pages[page_number - 1].mediabox[2]),
-            float(pdf_file.pages[page_number - 1].mediabox[3]),
-        ),
-    )
+    src_x = args[0]
+    src_y = args[1]
+    dest_x = args[2]
+    dest_y = args[3]
+    r = args[4]
+    g = args[5]
+    b = args[6]
+
+    return (
+        f"q {fp_str(r, g, b)} RG {fp_str(src_x, src_y)} m "
+        f"{fp_str(dest_x, dest_y)} l S Q"
+    ).encode()
+
+
+def rect_operators(*args) -> bytes:
+    """Returns the PDF operators that draw a rectangle."""
+
+    # pylint: disable=C0415
+    from reportlab.lib.rl_accel import fp_str
+
+    x = args[0]
+    y = args[1]
+    width = args[2]
+    height = args[3]
+
+    return f"{fp_str(x, y, width, height)} re S".encode()
+
+
+def build_content_stream(actions: Dict[str, List[list]]) -> bytes:
+    """
+    Builds a raw PDF content stream drawing lines and rectangles,
+    which unlike text and images need neither fonts nor a canvas.
+    """
+
+    result = []
+    for action_type, each in actions.items():
+        if action_type == "line":
+            result.extend(line_operators(*args) for args in each)
+        elif action_type == "rect":
+            result.extend(rect_operators(*args) for args in each)
+
+    return b"\n".join(result)
+
+
+def draw_actions(canvas: Canvas, action_type: str, actions: List[list]) -> None:
+    """Draws a list of stuffs of the same type on the watermark."""
 
     if action_type == "image":
         for each in actions:
@@ -152,19 +162,51 @@ def create_watermarks_and_draw(
     elif action_type == "text":
         for each in actions:
             draw_text(*([canvas, *each]))
-    elif action_type == "line":
-        for each in actions:
-            draw_line(*([canvas, *each]))
-    elif action_type == "rect":
-        for each in actions:
-            draw_rect(*([canvas, *each]))
+
+
+def create_page_watermark_and_draw(
+    page: PageObject,
+    actions: Dict[str, List[list]],
+) -> bytes:
+    """Creates a canvas watermark for a page and draw some stuffs on it."""
+
+    # pylint: disable=C0415
+    from reportlab.pdfgen.canvas import Canvas
+
+    buff = BytesIO()
+
+    canvas = Canvas(
+        buff,
+        pagesize=(
+            float(page.mediabox[2]),
+            float(page.mediabox[3]),
+        ),
+    )
+
+    for action_type, each in actions.items():
+        draw_actions(canvas, action_type, each)
 
     canvas.save()
-    buff.seek(0)
 
-    watermark = buff.read()
+    watermark = buff.getvalue()
     buff.close()
 
+    return watermark
+
+
+def create_watermarks_and_draw(
+    pdf: bytes,
+    page_number: int,
+    action_type: str,
+    actions: List[list],
+) -> List[bytes]:
+    """Creates a canvas watermark and draw some stuffs on it."""
+
+    pdf_file = PdfReader(stream_to_io(pdf))
+    watermark = create_page_watermark_and_draw(
+        pdf_file.pages[page_number - 1], {action_type: actions}
+    )
+
     return [
         watermark if i == page_number - 1 else b"" for i in range(len(pdf_file.pages))
     ]
@@ -173,11 +215,12 @@ def create_watermarks_and_draw(
 def merge_watermarks_with_pdf(
     pdf: bytes,
     watermarks: list,
+    reader: Union[PdfReader, None] = None,
 ) -> bytes:
-    """Merges watermarks with PDF."""
+    """Merges watermarks with PDF, reusing an already parsed reader of it if given."""
 
     result = BytesIO()
-    pdf_file = PdfReader(stream_to_io(pdf))
+    pdf_file = reader if reader is not None else PdfReader(stream_to_io(pdf))
     output = PdfWriter()
 
     for i, page in enumerate(pdf_file.pages):
@@ -188,5 +231,31 @@ def merge_watermarks_with_pdf(
         output.add_page(page)
 
     output.write(result)
-    result.seek(0)
-    return result.read()
+    return result.getvalue()
+
+
+def merge_content_streams_with_pdf(
+    pdf: bytes,
+    content_streams: List[bytes],
+    reader: Union[PdfReader, None] = None,
+) -> bytes:
+    """Overlays raw content streams onto the pages of a PDF."""
+
+    result = BytesIO()
+    pdf_file = reader if reader is not None else PdfReader(stream_to_io(pdf))
+    output = PdfWriter()
+
+    for i, page in enumerate(pdf_file.pages):
+        if content_streams[i]:
+            # sized like the canvas of a watermark, as merge_page clips to it
+            overlay = PageObject.create_blank_page(
+                width=page.mediabox[2], height=page.mediabox[3]
+            )
+            contents = DecodedStreamObject()
+            contents.set_data(content_streams[i])
+            overlay[NameObject(Contents)] = contents
+            page.merge_page(overlay)
+        output.add_page(page)
+
+    output.write(result)
+    return result.getvalue()
@@ -6,8 +6,6 @@ from typing import List, cast
 
 from pypdf import PdfReader, PdfWriter
 from pypdf.generic import DictionaryObject
-from reportlab.lib.colors import Color
-from reportlab.pdfgen.canvas import Canvas
 
 from ..constants import Annots
 from ..patterns import NON_ACRO_FORM_PARAM_TO_FUNC
@@ -34,6 +32,9 @@ class Widget:
     ) -> None:
         """Sets acro form parameters."""
 
+        # pylint: disable=C0415
+        from reportlab.lib.colors import Color
+
         super().__init__()
         self.page_number = page_number
         self.acro_form_params = {
@@ -67,6 +68,9 @@ class Widget:
     def watermarks(self, stream: bytes) -> List[bytes]:
         """Returns a list of watermarks after creating the widget."""
 
+        # pylint: disable=C0415
+        from reportlab.pdfgen.canvas import Canvas
+
         pdf = PdfReader(stream_to_io(stream))
         page_count = len(pdf.pages)
         watermark = BytesIO()
@@ -83,10 +87,10 @@ class Widget:
 
         canvas.showPage()
         canvas.save()
-        watermark.seek(0)
+        result = watermark.getvalue()
 
         return [
-            watermark.read() if i == self.page_number - 1 else b""
+            result if i == self.page_number - 1 else b""
             for i in range(page_count)
         ]
 
@@ -101,7 +105,7 @@ def handle_non_acro_form_params(pdf: bytes, key: str, params: list) -> bytes:
     for page in out.pages:
         for annot in page.get(Annots, []):  # noqa
             annot = cast(DictionaryObject, annot.get_object())
-            _key = get_widget_key(annot.get_object())
+            _key = get_widget_key(annot)
 
             if _key == key:
                 for param in params:
@@ -110,5 +114,4 @@ def handle_non_acro_form_params(pdf: bytes, key: str, params: list) -> bytes:
 
     with BytesIO() as f:
         out.write(f)
-        f.seek(0)
-        return f.read()
+        return f.getvalue()
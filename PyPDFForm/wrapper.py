@@ -18,10 +18,12 @@ from .middleware.dropdown import Dropdown
 from .middleware.text import Text
 from .template import (build_widgets, dropdown_to_text,
                        set_character_x_paddings, update_text_field_attributes,
-                       update_widget_keys, widget_rect_watermarks)
+                       update_widget_keys, widget_rect_content_streams)
 from .utils import (get_page_streams, merge_two_pdfs, preview_widget_to_draw,
                     remove_all_widgets)
-from .watermark import create_watermarks_and_draw, merge_watermarks_with_pdf
+from .watermark import (create_watermarks_and_draw,
+                        merge_content_streams_with_pdf,
+                        merge_watermarks_with_pdf)
 from .widgets.base import handle_non_acro_form_params
 from .widgets.checkbox import CheckBoxWidget
 from .widgets.dropdown import DropdownWidget
@@ -100,10 +102,9 @@ class PdfWrapper(FormWrapper):
         self.widgets = new_widgets
 
         for key, value in self.widgets.items():
-            if (key_to_refresh and key == key_to_refresh) or (
-                key_to_refresh is None
-                and isinstance(value, Text)
-                and not refresh_not_needed.get(key)
+            if isinstance(value, Text) and (
+                (key_to_refresh and key == key_to_refresh)
+                or (key_to_refresh is None and not refresh_not_needed.get(key))
             ):
                 value.font = self.global_font
                 value.font_size = self.global_font_size
@@ -161,7 +162,7 @@ class PdfWrapper(FormWrapper):
         """Inspects all supported widgets' names for the PDF form."""
 
         return remove_all_widgets(
-            merge_watermarks_with_pdf(
+            merge_content_streams_with_pdf(
                 fill(
                     self.stream,
                     {
@@ -169,7 +170,7 @@ class PdfWrapper(FormWrapper):
                         for key, value in self.widgets.items()
                     },
                 ),
-                widget_rect_watermarks(self.read()),
+                widget_rect_content_streams(self.read()),
             )
         )
 
@@ -179,8 +180,9 @@ class PdfWrapper(FormWrapper):
         """Inspects a coordinate grid of the PDF."""
 
         self.stream = generate_coordinate_grid(
-            merge_watermarks_with_pdf(
-                remove_all_widgets(self.read()), widget_rect_watermarks(self.read())
+            merge_content_streams_with_pdf(
+                remove_all_widgets(self.read()),
+                widget_rect_content_streams(self.read()),
             ),
             color,
             margin,
@@ -42,4 +42,5 @@ setuptools.setup(
     ],
     python_requires=">=3.8",
     install_requires=dependencies,
+    extras_require={"performance": ["simplejpeg"]},
 )
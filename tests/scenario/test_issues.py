@@ -2,6 +2,7 @@
 # pylint: disable=line-too-long
 
 import os
+from multiprocessing import Pool
 
 from PyPDFForm import PdfWrapper
 from PyPDFForm.constants import TU, Parent
@@ -23,6 +24,19 @@ def test_pdf_form_with_pages_without_widgets(issue_pdf_directory, request):
         assert obj.read() == expected
 
 
+def fill_ppf_246(path):
+    return PdfWrapper(path).fill({"QCredit": "5000.63"}).read()
+
+
+def test_pdf_form_with_many_pages_filled_in_daemon_process(issue_pdf_directory):
+    path = os.path.join(issue_pdf_directory, "PPF-246.pdf")
+    with Pool(1) as pool:
+        result = pool.apply(fill_ppf_246, (path,))
+
+    with open(os.path.join(issue_pdf_directory, "PPF-246-expected.pdf"), "rb+") as f:
+        assert result == f.read()
+
+
 def test_pdf_form_with_central_aligned_text_fields(issue_pdf_directory, request):
     obj = PdfWrapper(os.path.join(issue_pdf_directory, "PPF-285.pdf")).fill(
         {
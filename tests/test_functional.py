@@ -1,11 +1,22 @@
 # -*- coding: utf-8 -*-
 
 import os
+import sys
+from io import BytesIO
+from types import SimpleNamespace
 
 from jsonschema import ValidationError, validate
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import ContentStream, RectangleObject
+from reportlab.pdfbase.pdfmetrics import stringWidth
 
-from PyPDFForm import PdfWrapper, constants, template
+from PyPDFForm import PdfWrapper, constants, font, image, template, watermark
 from PyPDFForm.middleware.base import Widget
+from PyPDFForm.middleware.checkbox import Checkbox
+from PyPDFForm.middleware.dropdown import Dropdown
+from PyPDFForm.middleware.image import Image
+from PyPDFForm.middleware.radio import Radio
+from PyPDFForm.middleware.signature import Signature
 from PyPDFForm.middleware.text import Text
 
 
@@ -13,6 +24,56 @@ def test_base_schema_definition():
     assert Widget("foo").schema_definition == {}
 
 
+def test_cached_template_widgets_are_not_shared(template_stream, data_dict):
+    filled = PdfWrapper(template_stream)
+    filled.widgets["test"].font_size = 20
+    filled.fill(data_dict)
+
+    fresh = PdfWrapper(template_stream)
+    assert fresh.widgets["test"].value is None
+    assert fresh.widgets["test"].font_size is None
+
+
+def test_middleware_has_no_instance_dict():
+    for each in (Checkbox, Dropdown, Image, Radio, Signature, Text):
+        assert not hasattr(each("foo"), "__dict__")
+
+
+def test_build_content_stream():
+    assert watermark.build_content_stream(
+        {
+            "line": [[0, 0.5, 100, 200.25, 1, 0, 0]],
+            "rect": [[10, 20, 30.5, 40], [1, 2, 3, 4]],
+        }
+    ) == (
+        b"q 1 0 0 RG 0 .5 m 100 200.25 l S Q\n"
+        b"10 20 30.5 40 re S\n"
+        b"1 2 3 4 re S"
+    )
+
+
+def test_merge_content_streams_with_offset_mediabox():
+    writer = PdfWriter()
+    writer.add_blank_page(612, 792).mediabox = RectangleObject([100, 100, 712, 892])
+    with BytesIO() as f:
+        writer.write(f)
+        pdf = f.getvalue()
+
+    result = watermark.merge_content_streams_with_pdf(
+        pdf, [watermark.build_content_stream({"rect": [[650, 850, 20, 20]]})]
+    )
+
+    page = PdfReader(BytesIO(result)).pages[0]
+    operations = ContentStream(page.get_contents(), None).operations
+    clip = next(
+        operands
+        for i, (operands, operator) in enumerate(operations)
+        if operator == b"re" and operations[i + 1][1] == b"W"
+    )
+    assert [float(each) for each in clip] == [0, 0, 712, 892]
+    assert ([650, 850, 20, 20], b"re") in operations
+
+
 def test_fill(template_stream, pdf_samples, data_dict, request):
     expected_path = os.path.join(pdf_samples, "sample_filled.pdf")
     with open(expected_path, "rb+") as f:
@@ -39,6 +100,19 @@ def test_register_bad_fonts():
     assert not PdfWrapper.register_font("foo", "foo")
 
 
+def test_register_font_clears_cached_string_widths(font_samples):
+    font.get_string_width("foo bar", constants.DEFAULT_FONT, 12)
+    assert font.get_string_width.cache_info().currsize
+
+    with open(os.path.join(font_samples, "LiberationSerif-Regular.ttf"), "rb+") as f:
+        assert PdfWrapper.register_font("LiberationSerif-Regular", f.read())
+
+    assert not font.get_string_width.cache_info().currsize
+    assert font.get_string_width(
+        "foo bar", "LiberationSerif-Regular", 12
+    ) == stringWidth("foo bar", "LiberationSerif-Regular", 12)
+
+
 def test_fill_font_liberation_serif_italic(
     template_stream, pdf_samples, font_samples, data_dict, request
 ):
@@ -284,6 +358,43 @@ def test_draw_png_image_on_one_page(
             assert obj.stream == expected
 
 
+def test_png_image_encoded_with_simplejpeg(image_samples, monkeypatch):
+    encoded = []
+
+    def encode_jpeg(array, quality, colorspace, colorsubsampling):
+        encoded.append((array.mode, quality, colorspace, colorsubsampling))
+        return b"simplejpeg"
+
+    monkeypatch.setattr(
+        image,
+        "import_simplejpeg",
+        lambda: (
+            SimpleNamespace(asarray=lambda img: img),
+            SimpleNamespace(encode_jpeg=encode_jpeg),
+        ),
+    )
+    with open(os.path.join(image_samples, "sample_png_image.png"), "rb+") as f:
+        stream = f.read()
+
+    assert image.any_image_to_jpg(stream) == b"simplejpeg"
+    assert encoded == [("RGB", 75, "RGB", "420")]
+
+
+def test_import_simplejpeg(monkeypatch):
+    numpy = SimpleNamespace()
+    simplejpeg = SimpleNamespace()
+    monkeypatch.setitem(sys.modules, "numpy", numpy)
+    monkeypatch.setitem(sys.modules, "simplejpeg", simplejpeg)
+    image.import_simplejpeg.cache_clear()
+    assert image.import_simplejpeg() == (numpy, simplejpeg)
+
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    image.import_simplejpeg.cache_clear()
+    assert image.import_simplejpeg() is None
+
+    image.import_simplejpeg.cache_clear()
+
+
 def test_draw_transparent_png_image_on_one_page(
     template_stream, image_samples, pdf_samples, request
 ):